@@ -10,6 +10,7 @@ from pathlib import Path
 
 import django
 from django.conf import settings
+from django.test.runner import get_max_test_processes
 from django.test.utils import get_runner
 
 
@@ -61,6 +62,10 @@ def setup_and_run_tests(test_labels=None):
     if envbool("CONTINUOUS_INTEGRATION") and not envbool("ANYMAIL_RUN_LIVE_TESTS"):
         exclude_tags.append("live")
 
+    # Tests are all SimpleTestCase (no database), so they can run in parallel
+    # processes without any test database setup:
+    parallel = envparallel("ANYMAIL_PARALLEL_TESTS")
+
     if tags:
         print("Only running tests tagged: %r" % tags)
     if exclude_tags:
@@ -75,7 +80,9 @@ def setup_and_run_tests(test_labels=None):
     django.setup()
 
     TestRunner = get_runner(settings)
-    test_runner = TestRunner(verbosity=1, tags=tags, exclude_tags=exclude_tags)
+    test_runner = TestRunner(
+        verbosity=1, tags=tags, exclude_tags=exclude_tags, parallel=parallel
+    )
     return test_runner.run_tests(test_labels)
 
 
@@ -116,5 +123,29 @@ def envlist(var):
     return val
 
 
+def envparallel(var):
+    """Returns number of test processes from environment variable var.
+
+    Accepts an integer or `'auto'` (one process per core, like Django's
+    :option:`test --parallel` option). Returns 0 (don't run in parallel)
+    if the variable is empty or not set.
+    """
+    val = os.getenv(var, "").strip().lower()
+    if val == "":
+        return 0
+    elif val == "auto":
+        return get_max_test_processes()
+    try:
+        processes = int(val)
+    except ValueError:
+        processes = -1
+    if processes < 0:
+        raise ValueError(
+            "invalid number of processes env[%r]=%r (use 'auto' or an integer >= 0)"
+            % (var, val)
+        )
+    return processes
+
+
 if __name__ == "__main__":
     runtests(test_labels=sys.argv[1:])
@@ -13,6 +13,25 @@ from .utils import AnymailTestMixin
 UNSET = object()
 
 
+def _unpickle_response(state):
+    response = requests.Response()
+    response.__setstate__(state)
+    return response
+
+
+class NoopAdapter(requests.adapters.BaseAdapter):
+    """requests transport adapter that never creates a urllib3 connection pool
+
+    (Session.request is mocked in these tests, so nothing is ever sent.)
+    """
+
+    def send(self, request, **kwargs):
+        raise AssertionError("NoopAdapter can't send %r" % request)
+
+    def close(self):
+        pass
+
+
 class RequestsBackendMockAPITestCase(AnymailTestMixin, SimpleTestCase):
     """TestCase that mocks API calls through requests"""
 
@@ -50,11 +69,31 @@ class RequestsBackendMockAPITestCase(AnymailTestMixin, SimpleTestCase):
             if url is not None:
                 raise ValueError("MockResponse can't handle url assignment")
 
+        def __reduce__(self):
+            # Pickle as a plain requests.Response (without the test_case),
+            # so errors carrying a MockResponse can be reported from
+            # parallel test processes
+            return _unpickle_response, (self.__getstate__(),)
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # The patch is shared by all tests in the class;
+        # setUp just resets the mock's state for each test.
+        cls.patch_request = patch("requests.Session.request", autospec=True)
+        # (staticmethod keeps the autospec'd function from binding to self)
+        cls.mock_request = staticmethod(cls.patch_request.start())
+        cls.addClassCleanup(cls.patch_request.stop)
+        # Avoid constructing a real HTTPAdapter (and its PoolManager)
+        # for every requests.Session the backends create:
+        patch_adapter = patch("requests.sessions.HTTPAdapter", NoopAdapter)
+        patch_adapter.start()
+        cls.addClassCleanup(patch_adapter.stop)
+
     def setUp(self):
         super().setUp()
-        self.patch_request = patch("requests.Session.request", autospec=True)
-        self.mock_request = self.patch_request.start()
-        self.addCleanup(self.patch_request.stop)
+        self.mock_request.reset_mock()
+        self.mock_request.side_effect = None
         self.set_mock_response()
 
     def set_mock_response(
@@ -1,5 +1,5 @@
 import json
-from base64 import b64decode, b64encode
+from base64 import b64encode
 from datetime import date, datetime, timezone
 from decimal import Decimal
 from email.mime.base import MIMEBase
@@ -27,7 +27,9 @@ from .mock_requests_backend import (
 from .utils import (
     SAMPLE_IMAGE_FILENAME,
     AnymailTestMixin,
+    decode_att_str,
     sample_image_content,
+    sample_image_content_b64,
     sample_image_path,
 )
 
@@ -41,6 +43,8 @@ class BrevoBackendMockAPITestCase(RequestsBackendMockAPITestCase):
     DEFAULT_RAW_RESPONSE = (
         b'{"messageId":"<201801020304.1234567890@smtp-relay.mailin.fr>"}'
     )
+    DEFAULT_PARSED_RESPONSE = json.loads(DEFAULT_RAW_RESPONSE)
+    DEFAULT_MESSAGE_ID = DEFAULT_PARSED_RESPONSE["messageId"]
     DEFAULT_STATUS_CODE = 201  # Brevo v3 uses '201 Created' for success (in most cases)
 
     def setUp(self):
@@ -69,11 +73,15 @@ class BrevoBackendStandardEmailTests(BrevoBackendMockAPITestCase):
         self.assertEqual(http_headers["api-key"], "test_api_key")
         self.assertEqual(http_headers["Content-Type"], "application/json")
 
-        data = self.get_api_call_json()
-        self.assertEqual(data["subject"], "Subject here")
-        self.assertEqual(data["textContent"], "Here is the message.")
-        self.assertEqual(data["sender"], {"email": "from@sender.example.com"})
-        self.assertEqual(data["to"], [{"email": "to@example.com"}])
+        self.assertDictMatches(
+            {
+                "subject": "Subject here",
+                "textContent": "Here is the message.",
+                "sender": {"email": "from@sender.example.com"},
+                "to": [{"email": "to@example.com"}],
+            },
+            self.get_api_call_json(),
+        )
 
     def test_name_addr(self):
         """Make sure RFC2822 name-addr format (with display-name) is allowed
@@ -131,17 +139,18 @@ class BrevoBackendStandardEmailTests(BrevoBackendMockAPITestCase):
             },
         )
         email.send()
-        data = self.get_api_call_json()
-        self.assertEqual(data["sender"], {"email": "from@example.com"})
-        self.assertEqual(data["subject"], "Subject")
-        self.assertEqual(data["textContent"], "Body goes here")
-        self.assertEqual(data["replyTo"], {"email": "another@example.com"})
-        self.assertEqual(
-            data["headers"],
+        self.assertDictMatches(
             {
-                "X-MyHeader": "my value",
-                "Message-ID": "<mycustommsgid@sales.example.com>",
+                "sender": {"email": "from@example.com"},
+                "subject": "Subject",
+                "textContent": "Body goes here",
+                "replyTo": {"email": "another@example.com"},
+                "headers": {
+                    "X-MyHeader": "my value",
+                    "Message-ID": "<mycustommsgid@sales.example.com>",
+                },
             },
+            self.get_api_call_json(),
         )
 
     def test_html_message(self):
@@ -266,9 +275,7 @@ class BrevoBackendStandardEmailTests(BrevoBackendMockAPITestCase):
         self.message.send()
         attachment = self.get_api_call_json()["attachment"][0]
         self.assertEqual(attachment["name"], "Une pièce jointe.html")
-        self.assertEqual(
-            b64decode(attachment["content"]).decode("utf-8"), "<p>\u2019</p>"
-        )
+        self.assertEqual(decode_att_str(attachment["content"]), "<p>\u2019</p>")
 
     def test_embedded_images(self):
         # Brevo doesn't support inline image
@@ -300,7 +307,7 @@ class BrevoBackendStandardEmailTests(BrevoBackendMockAPITestCase):
 
         self.message.send()
 
-        image_data_b64 = b64encode(image_data).decode("ascii")
+        image_data_b64 = sample_image_content_b64(image_filename)
         data = self.get_api_call_json()
         self.assertEqual(
             data["attachment"][0],
@@ -470,10 +477,14 @@ class BrevoBackendAnymailFeatureTests(BrevoBackendMockAPITestCase):
         # Brevo uses per-account numeric ID to identify templates:
         message.template_id = 12
         message.send()
-        data = self.get_api_call_json()
-        self.assertEqual(data["templateId"], 12)
-        self.assertEqual(data["subject"], "My Subject")
-        self.assertEqual(data["to"], [{"email": "to@example.com", "name": "Recipient"}])
+        self.assertDictMatches(
+            {
+                "templateId": 12,
+                "subject": "My Subject",
+                "to": [{"email": "to@example.com", "name": "Recipient"}],
+            },
+            self.get_api_call_json(),
+        )
 
     _mock_batch_response = {
         "messageIds": [
@@ -499,24 +510,22 @@ class BrevoBackendAnymailFeatureTests(BrevoBackendMockAPITestCase):
 
         # batch send uses same API endpoint as regular send:
         self.assert_esp_called("/v3/smtp/email")
-        data = self.get_api_call_json()
-        versions = data["messageVersions"]
-        self.assertEqual(len(versions), 2)
-        self.assertEqual(
-            versions[0],
+        self.assertDictMatches(
             {
-                "to": [{"email": "alice@example.com"}],
-                "params": {"name": "Alice", "group": "Developers"},
+                "messageVersions": [
+                    {
+                        "to": [{"email": "alice@example.com"}],
+                        "params": {"name": "Alice", "group": "Developers"},
+                    },
+                    {
+                        "to": [{"email": "bob@example.com", "name": "Bob"}],
+                        "params": {"name": "Bob"},
+                    },
+                ],
+                "params": {"group": "Users", "site": "ExampleCo"},
             },
+            self.get_api_call_json(),
         )
-        self.assertEqual(
-            versions[1],
-            {
-                "to": [{"email": "bob@example.com", "name": "Bob"}],
-                "params": {"name": "Bob"},
-            },
-        )
-        self.assertEqual(data["params"], {"group": "Users", "site": "ExampleCo"})
 
         recipients = message.anymail_status.recipients
         self.assertEqual(recipients["alice@example.com"].status, "queued")
@@ -655,17 +664,10 @@ class BrevoBackendAnymailFeatureTests(BrevoBackendMockAPITestCase):
             msg.anymail_status.esp_response.content, self.DEFAULT_RAW_RESPONSE
         )
 
-        self.assertEqual(
-            msg.anymail_status.message_id,
-            json.loads(msg.anymail_status.esp_response.content.decode("utf-8"))[
-                "messageId"
-            ],
-        )
+        self.assertEqual(msg.anymail_status.message_id, self.DEFAULT_MESSAGE_ID)
         self.assertEqual(
             msg.anymail_status.recipients["to1@example.com"].message_id,
-            json.loads(msg.anymail_status.esp_response.content.decode("utf-8"))[
-                "messageId"
-            ],
+            self.DEFAULT_MESSAGE_ID,
         )
 
     # noinspection PyUnresolvedReferences
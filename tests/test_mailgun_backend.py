@@ -1085,9 +1085,8 @@ class MailgunBackendImproperlyConfiguredTests(AnymailTestMixin, SimpleTestCase):
     """Test ESP backend without required settings in place"""
 
     def test_missing_api_key(self):
-        with self.assertRaises(ImproperlyConfigured) as cm:
-            mail.send_mail("Subject", "Message", "from@example.com", ["to@example.com"])
-        errmsg = str(cm.exception)
         # Make sure the error mentions MAILGUN_API_KEY and ANYMAIL_MAILGUN_API_KEY
-        self.assertRegex(errmsg, r"\bMAILGUN_API_KEY\b")
-        self.assertRegex(errmsg, r"\bANYMAIL_MAILGUN_API_KEY\b")
+        with self.assertRaisesRegex(
+            ImproperlyConfigured, r"\bANYMAIL_MAILGUN_API_KEY\b.*\bMAILGUN_API_KEY\b"
+        ):
+            mail.send_mail("Subject", "Message", "from@example.com", ["to@example.com"])
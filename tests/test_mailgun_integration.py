@@ -256,16 +256,6 @@ class MailgunBackendIntegrationTests(AnymailTestMixin, SimpleTestCase):
         recipient_status = message.anymail_status.recipients
         self.assertEqual(recipient_status["test+to1@anymail.dev"].status, "queued")
 
-    # As of Anymail 0.10, this test is no longer possible, because
-    # Anymail now raises AnymailInvalidAddress without even calling Mailgun
-    # def test_invalid_from(self):
-    #     self.message.from_email = 'webmaster'
-    #     with self.assertRaises(AnymailAPIError) as cm:
-    #         self.message.send()
-    #     err = cm.exception
-    #     self.assertEqual(err.status_code, 400)
-    #     self.assertIn("'from' parameter is not a valid address", str(err))
-
     @override_settings(
         ANYMAIL={
             "MAILGUN_API_KEY": "Hey, that's not an API key",
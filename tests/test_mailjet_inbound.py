@@ -8,7 +8,12 @@ from anymail.inbound import AnymailInboundMessage
 from anymail.signals import AnymailInboundEvent
 from anymail.webhooks.mailjet import MailjetInboundWebhookView
 
-from .utils import sample_email_content, sample_image_content
+from .utils import (
+    sample_email_content,
+    sample_email_content_b64,
+    sample_image_content,
+    sample_image_content_b64,
+)
 from .webhook_cases import WebhookTestCase
 
 
@@ -176,9 +181,9 @@ class MailjetInboundTestCase(WebhookTestCase):
             ],
             "Text-part": "Test body plain",
             "Html-part": "<div>Test body html <img src='cid:abc123'></div>",
-            "InlineAttachment1": b64encode(image_content).decode("ascii"),
+            "InlineAttachment1": sample_image_content_b64(),
             "Attachment1": b64encode("test attachment".encode("utf-8")).decode("ascii"),
-            "Attachment2": b64encode(email_content).decode("ascii"),
+            "Attachment2": sample_email_content_b64(),
         }
 
         response = self.client.post(
@@ -68,7 +68,7 @@ class MailjetBackendIntegrationTests(AnymailTestMixin, SimpleTestCase):
         message_id = anymail_status.recipients["test+to1@anymail.dev"].message_id
 
         self.assertEqual(sent_status, "sent")
-        self.assertRegex(message_id, r".+")
+        self.assertGreater(len(message_id), 0)  # non-empty string
         # set of all recipient statuses:
         self.assertEqual(anymail_status.status, {sent_status})
         self.assertEqual(anymail_status.message_id, message_id)
@@ -11,8 +11,8 @@ from anymail.inbound import AnymailInboundMessage
 from anymail.signals import AnymailInboundEvent
 from anymail.webhooks.postal import PostalInboundWebhookView
 
-from .utils import sample_email_content, sample_image_content
-from .utils_postal import ClientWithPostalSignature, make_key
+from .utils import sample_email_content, sample_image_content, sample_image_content_b64
+from .utils_postal import ClientWithPostalSignature, shared_key
 from .webhook_cases import WebhookTestCase
 
 
@@ -27,7 +27,7 @@ class PostalInboundTestCase(WebhookTestCase):
         super().setUp()
         self.clear_basic_auth()
 
-        self.client.set_private_key(make_key())
+        self.client.set_private_key(shared_key())
 
     def test_inbound_basics(self):
         raw_event = {
@@ -168,7 +168,7 @@ class PostalInboundTestCase(WebhookTestCase):
             --boundary0--
             """  # NOQA: E501
         ).format(
-            image_content_base64=b64encode(image_content).decode("ascii"),
+            image_content_base64=sample_image_content_b64(),
             email_content=email_content.decode("ascii"),
         )
 
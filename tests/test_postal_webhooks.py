@@ -10,7 +10,7 @@ from anymail.exceptions import AnymailConfigurationError
 from anymail.signals import AnymailTrackingEvent
 from anymail.webhooks.postal import PostalTrackingWebhookView
 
-from .utils_postal import ClientWithPostalSignature, make_key
+from .utils_postal import ClientWithPostalSignature, shared_key
 from .webhook_cases import WebhookTestCase
 
 
@@ -25,7 +25,7 @@ class PostalWebhookSecurityTestCase(WebhookTestCase):
         super().setUp()
         self.clear_basic_auth()
 
-        self.client.set_private_key(make_key())
+        self.client.set_private_key(shared_key())
 
     def test_failed_signature_check(self):
         response = self.client.post(
@@ -64,7 +64,7 @@ class PostalDeliveryTestCase(WebhookTestCase):
         super().setUp()
         self.clear_basic_auth()
 
-        self.client.set_private_key(make_key())
+        self.client.set_private_key(shared_key())
 
     def test_bounce_event(self):
         raw_event = {
@@ -26,6 +26,7 @@ from .utils import (
     AnymailTestMixin,
     decode_att,
     sample_image_content,
+    sample_image_content_b64,
     sample_image_path,
 )
 
@@ -220,26 +221,26 @@ class PostmarkBackendStandardEmailTests(PostmarkBackendMockAPITestCase):
 
         self.message.send()
         data = self.get_api_call_json()
-        attachments = data["Attachments"]
-        self.assertEqual(len(attachments), 3)
-        self.assertEqual(attachments[0]["Name"], "test.txt")
-        self.assertEqual(attachments[0]["ContentType"], "text/plain")
         self.assertEqual(
-            decode_att(attachments[0]["Content"]).decode("ascii"), text_content
+            data["Attachments"],
+            [
+                {
+                    "Name": "test.txt",
+                    "ContentType": "text/plain",
+                    "Content": b64encode(text_content.encode("ascii")).decode("ascii"),
+                },
+                {
+                    "Name": "test.png",
+                    "ContentType": "image/png",  # inferred from filename
+                    "Content": b64encode(png_content).decode("ascii"),
+                },
+                {
+                    "Name": "",  # none
+                    "ContentType": "application/pdf",
+                    "Content": b64encode(pdf_content).decode("ascii"),
+                },
+            ],
         )
-        self.assertNotIn("ContentID", attachments[0])
-
-        # ContentType inferred from filename:
-        self.assertEqual(attachments[1]["ContentType"], "image/png")
-        self.assertEqual(attachments[1]["Name"], "test.png")
-        self.assertEqual(decode_att(attachments[1]["Content"]), png_content)
-        # make sure image not treated as inline:
-        self.assertNotIn("ContentID", attachments[1])
-
-        self.assertEqual(attachments[2]["ContentType"], "application/pdf")
-        self.assertEqual(attachments[2]["Name"], "")  # none
-        self.assertEqual(decode_att(attachments[2]["Content"]), pdf_content)
-        self.assertNotIn("ContentID", attachments[2])
 
     def test_unicode_attachment_correctly_decoded(self):
         self.message.attach(
@@ -294,7 +295,7 @@ class PostmarkBackendStandardEmailTests(PostmarkBackendMockAPITestCase):
         image = MIMEImage(image_data)
         self.message.attach(image)
 
-        image_data_b64 = b64encode(image_data).decode("ascii")
+        image_data_b64 = sample_image_content_b64(image_filename)
 
         self.message.send()
         data = self.get_api_call_json()
@@ -1111,8 +1112,8 @@ class PostmarkBackendImproperlyConfiguredTests(AnymailTestMixin, SimpleTestCase)
     """Test ESP backend without required settings in place"""
 
     def test_missing_api_key(self):
-        with self.assertRaises(ImproperlyConfigured) as cm:
+        with self.assertRaisesRegex(
+            ImproperlyConfigured,
+            r"\bANYMAIL_POSTMARK_SERVER_TOKEN\b.*\bPOSTMARK_SERVER_TOKEN\b",
+        ):
             mail.send_mail("Subject", "Message", "from@example.com", ["to@example.com"])
-        errmsg = str(cm.exception)
-        self.assertRegex(errmsg, r"\bPOSTMARK_SERVER_TOKEN\b")
-        self.assertRegex(errmsg, r"\bANYMAIL_POSTMARK_SERVER_TOKEN\b")
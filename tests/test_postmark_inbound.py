@@ -10,7 +10,13 @@ from anymail.inbound import AnymailInboundMessage
 from anymail.signals import AnymailInboundEvent
 from anymail.webhooks.postmark import PostmarkInboundWebhookView
 
-from .utils import sample_email_content, sample_image_content, test_file_content
+from .utils import (
+    sample_email_content,
+    sample_email_content_b64,
+    sample_image_content,
+    sample_image_content_b64,
+    test_file_content,
+)
 from .webhook_cases import WebhookTestCase
 
 
@@ -153,14 +159,14 @@ class PostmarkInboundTestCase(WebhookTestCase):
                 },
                 {
                     "Name": "image.png",
-                    "Content": b64encode(image_content).decode("ascii"),
+                    "Content": sample_image_content_b64(),
                     "ContentType": "image/png",
                     "ContentID": "abc123",
                     "ContentLength": len(image_content),
                 },
                 {
                     "Name": "bounce.txt",
-                    "Content": b64encode(email_content).decode("ascii"),
+                    "Content": sample_email_content_b64(),
                     "ContentType": 'message/rfc822; charset="us-ascii"',
                     "ContentLength": len(email_content),
                 },
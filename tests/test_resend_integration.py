@@ -124,8 +124,8 @@ class ResendBackendIntegrationTests(AnymailTestMixin, SimpleTestCase):
         recipient_status = message.anymail_status.recipients
         self.assertEqual(recipient_status["test+to1@anymail.dev"].status, "queued")
         self.assertEqual(recipient_status["test+to2@anymail.dev"].status, "queued")
-        self.assertRegex(recipient_status["test+to1@anymail.dev"].message_id, r".+")
-        self.assertRegex(recipient_status["test+to2@anymail.dev"].message_id, r".+")
+        self.assertGreater(len(recipient_status["test+to1@anymail.dev"].message_id), 0)
+        self.assertGreater(len(recipient_status["test+to2@anymail.dev"].message_id), 0)
         # Each recipient gets their own message_id:
         self.assertNotEqual(
             recipient_status["test+to1@anymail.dev"].message_id,
@@ -1,4 +1,4 @@
-from base64 import b64decode, b64encode
+from base64 import b64encode
 from calendar import timegm
 from datetime import date, datetime
 from decimal import Decimal
@@ -29,7 +29,9 @@ from .mock_requests_backend import (
 from .utils import (
     SAMPLE_IMAGE_FILENAME,
     AnymailTestMixin,
+    decode_att_str,
     sample_image_content,
+    sample_image_content_b64,
     sample_image_path,
 )
 
@@ -321,14 +323,11 @@ class SendGridBackendStandardEmailTests(SendGridBackendMockAPITestCase):
         self.message.send()
         attachment = self.get_api_call_json()["attachments"][0]
         self.assertEqual(attachment["filename"], "Une pièce jointe.html")
-        self.assertEqual(
-            b64decode(attachment["content"]).decode("utf-8"), "<p>\u2019</p>"
-        )
+        self.assertEqual(decode_att_str(attachment["content"]), "<p>\u2019</p>")
 
     def test_embedded_images(self):
         image_filename = SAMPLE_IMAGE_FILENAME
         image_path = sample_image_path(image_filename)
-        image_data = sample_image_content(image_filename)
 
         cid = attach_inline_image_file(self.message, image_path)  # Read from a png file
         html_content = (
@@ -343,7 +342,7 @@ class SendGridBackendStandardEmailTests(SendGridBackendMockAPITestCase):
             data["attachments"][0],
             {
                 "filename": image_filename,
-                "content": b64encode(image_data).decode("ascii"),
+                "content": sample_image_content_b64(image_filename),
                 "type": "image/png",  # (type inferred from filename)
                 "disposition": "inline",
                 "content_id": cid,
@@ -364,7 +363,7 @@ class SendGridBackendStandardEmailTests(SendGridBackendMockAPITestCase):
 
         self.message.send()
 
-        image_data_b64 = b64encode(image_data).decode("ascii")
+        image_data_b64 = sample_image_content_b64(image_filename)
         data = self.get_api_call_json()
         self.assertEqual(
             data["attachments"][0],
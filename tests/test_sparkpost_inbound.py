@@ -9,7 +9,7 @@ from anymail.inbound import AnymailInboundMessage
 from anymail.signals import AnymailInboundEvent
 from anymail.webhooks.sparkpost import SparkPostInboundWebhookView
 
-from .utils import sample_email_content, sample_image_content
+from .utils import sample_email_content, sample_image_content, sample_image_content_b64
 from .webhook_cases import WebhookTestCase
 
 
@@ -156,7 +156,7 @@ class SparkpostInboundTestCase(WebhookTestCase):
             --boundary0--
             """  # NOQA: E501
         ).format(
-            image_content_base64=b64encode(image_content).decode("ascii"),
+            image_content_base64=sample_image_content_b64(),
             email_content=email_content.decode("ascii"),
         )
 
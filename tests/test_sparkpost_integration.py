@@ -62,7 +62,7 @@ class SparkPostBackendIntegrationTests(AnymailTestMixin, SimpleTestCase):
 
         self.assertEqual(sent_status, "queued")  # SparkPost always queues
         # this is actually the transmission_id; should be non-blank:
-        self.assertRegex(message_id, r".+")
+        self.assertGreater(len(message_id), 0)  # non-empty string
         # set of all recipient statuses:
         self.assertEqual(anymail_status.status, {sent_status})
         self.assertEqual(anymail_status.message_id, message_id)
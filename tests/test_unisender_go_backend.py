@@ -30,6 +30,7 @@ from .utils import (
     SAMPLE_IMAGE_FILENAME,
     AnymailTestMixin,
     sample_image_content,
+    sample_image_content_b64,
     sample_image_path,
 )
 
@@ -328,7 +329,6 @@ class UnisenderGoBackendStandardEmailTests(UnisenderGoBackendMockAPITestCase):
     def test_embedded_images(self):
         image_filename = SAMPLE_IMAGE_FILENAME
         image_path = sample_image_path(image_filename)
-        image_data = sample_image_content(image_filename)
 
         cid = attach_inline_image_file(self.message, image_path)  # Read from a png file
         html_content = (
@@ -344,7 +344,7 @@ class UnisenderGoBackendStandardEmailTests(UnisenderGoBackendMockAPITestCase):
             [
                 {
                     "name": cid,
-                    "content": b64encode(image_data).decode("ascii"),
+                    "content": sample_image_content_b64(image_filename),
                     "type": "image/png",  # (type inferred from filename)
                 }
             ],
@@ -364,7 +364,7 @@ class UnisenderGoBackendStandardEmailTests(UnisenderGoBackendMockAPITestCase):
 
         self.message.send()
 
-        image_data_b64 = b64encode(image_data).decode("ascii")
+        image_data_b64 = sample_image_content_b64(image_filename)
         data = self.get_api_call_json()
         self.assertEqual(
             data["message"]["attachments"][0],
@@ -69,7 +69,7 @@ class UnisenderGoBackendIntegrationTests(AnymailTestMixin, SimpleTestCase):
         message_id = anymail_status.recipients["test+to1@anymail.dev"].message_id
 
         self.assertEqual(sent_status, "queued")  # Unisender Go always queues
-        self.assertRegex(message_id, r".+")
+        self.assertGreater(len(message_id), 0)  # non-empty string
         # set of all recipient statuses:
         self.assertEqual(anymail_status.status, {sent_status})
         self.assertEqual(anymail_status.message_id, message_id)
@@ -112,8 +112,8 @@ class UnisenderGoBackendIntegrationTests(AnymailTestMixin, SimpleTestCase):
         recipient_status = message.anymail_status.recipients
         self.assertEqual(recipient_status["test+to1@anymail.dev"].status, "queued")
         self.assertEqual(recipient_status["test+to2@anymail.dev"].status, "queued")
-        self.assertRegex(recipient_status["test+to1@anymail.dev"].message_id, r".+")
-        self.assertRegex(recipient_status["test+to2@anymail.dev"].message_id, r".+")
+        self.assertGreater(len(recipient_status["test+to1@anymail.dev"].message_id), 0)
+        self.assertGreater(len(recipient_status["test+to2@anymail.dev"].message_id), 0)
         # Anymail generates unique message_id for each recipient:
         self.assertNotEqual(
             recipient_status["test+to1@anymail.dev"].message_id,
@@ -169,8 +169,8 @@ class UnisenderGoBackendIntegrationTests(AnymailTestMixin, SimpleTestCase):
         recipient_status = message.anymail_status.recipients
         self.assertEqual(recipient_status["test+to1@anymail.dev"].status, "queued")
         self.assertEqual(recipient_status["test+to2@anymail.dev"].status, "queued")
-        self.assertRegex(recipient_status["test+to1@anymail.dev"].message_id, r".+")
-        self.assertRegex(recipient_status["test+to2@anymail.dev"].message_id, r".+")
+        self.assertGreater(len(recipient_status["test+to1@anymail.dev"].message_id), 0)
+        self.assertGreater(len(recipient_status["test+to2@anymail.dev"].message_id), 0)
         # Anymail generates unique message_id for each recipient:
         self.assertNotEqual(
             recipient_status["test+to1@anymail.dev"].message_id,
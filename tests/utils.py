@@ -1,10 +1,12 @@
 # Anymail test utils
+import binascii
 import re
 import sys
 import uuid
 import warnings
-from base64 import b64decode
+from base64 import b64encode
 from contextlib import contextmanager
+from functools import lru_cache
 from io import BytesIO, StringIO
 from pathlib import Path
 from unittest import TestCase
@@ -15,7 +17,12 @@ import django.test.client
 
 def decode_att(att):
     """Returns the original data from base64-encoded attachment content"""
-    return b64decode(att.encode("ascii"))
+    return binascii.a2b_base64(att)
+
+
+def decode_att_str(att, encoding="utf-8"):
+    """Returns the original text from base64-encoded attachment content"""
+    return binascii.a2b_base64(att).decode(encoding)
 
 
 def rfc822_unfold(text):
@@ -27,6 +34,8 @@ def rfc822_unfold(text):
 
 #
 # Sample files for testing (in ./test_files subdir)
+# (The files don't change during a test run, and the helpers return
+# immutable Paths or bytes, so most of the helpers are cached.)
 #
 
 TEST_FILES_DIR = Path(__file__).parent.joinpath("test_files").resolve()
@@ -40,26 +49,36 @@ def test_file_path(filename):
     return TEST_FILES_DIR.joinpath(filename)
 
 
+@lru_cache(maxsize=None)
 def test_file_content(filename):
     """Returns contents (bytes) of a test file"""
     return TEST_FILES_DIR.joinpath(filename).read_bytes()
 
 
+@lru_cache(maxsize=None)
 def sample_image_path(filename=SAMPLE_IMAGE_FILENAME):
     """Returns path to an actual image file in the tests directory"""
     return test_file_path(filename)
 
 
+@lru_cache(maxsize=None)
 def sample_image_content(filename=SAMPLE_IMAGE_FILENAME):
     """Returns contents of an actual image file from the tests directory"""
     return test_file_content(filename)
 
 
+@lru_cache(maxsize=None)
+def sample_image_content_b64(filename=SAMPLE_IMAGE_FILENAME):
+    """Returns base64-encoded (str) contents of an image file from the tests directory"""
+    return b64encode(sample_image_content(filename)).decode("ascii")
+
+
 def sample_email_path(filename=SAMPLE_EMAIL_FILENAME):
     """Returns path to an email file (e.g., for forwarding as an attachment)"""
     return test_file_path(filename)
 
 
+@lru_cache(maxsize=None)
 def sample_email_content(filename=SAMPLE_EMAIL_FILENAME):
     """
     Returns bytes contents of an email file (e.g., for forwarding as an attachment)
@@ -67,6 +86,12 @@ def sample_email_content(filename=SAMPLE_EMAIL_FILENAME):
     return test_file_content(filename)
 
 
+@lru_cache(maxsize=None)
+def sample_email_content_b64(filename=SAMPLE_EMAIL_FILENAME):
+    """Returns base64-encoded (str) contents of an email file"""
+    return b64encode(sample_email_content(filename)).decode("ascii")
+
+
 #
 # TestCase helpers
 #
@@ -1,4 +1,5 @@
 from base64 import b64encode
+from functools import lru_cache
 
 from django.test import override_settings
 
@@ -21,6 +22,15 @@ def make_key():
     return private_key
 
 
+@lru_cache(maxsize=None)
+def shared_key():
+    """Return an RSA key generated on first use and reused after that
+
+    (Key generation is slow, and the tests just need *some* valid key.)
+    """
+    return make_key()
+
+
 def derive_public_webhook_key(private_key):
     """Derive public"""
     public_key = private_key.public_key()